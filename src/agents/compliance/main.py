@@ -4,10 +4,9 @@
 # The handler returns a structured `findings` list and a summary.
 
 import os
-import re
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import boto3
 
 logger = logging.getLogger(__name__)
@@ -19,35 +18,14 @@ boto3.setup_default_session(region_name=_region)
 logger.info("Using AWS region for boto3: %s", _region)
 print(f"Using AWS region for boto3: {_region}")
 
-# Regexes for simple PII detection (GDPR-related)
-PII_PATTERNS = {
-    "email": re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+"),
-    "phone": re.compile(r"(?:\+\d{1,3}[\s-]?)?(?:\(\d+\)|\d+)[\s.-]?\d+[\s.-]?\d+"),
-    # US SSN-ish pattern (very approximate)
-    "ssn": re.compile(r"\b\d{3}-\d{2}-\d{4}\b"),
-    # Simple date pattern (may indicate DOB or deadlines)
-    "date": re.compile(r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b"),
-}
-
-# Keywords for SOX-ish checks (financial controls / audit related)
-SOX_KEYWORDS = [
-    "revenue",
-    "net income",
-    "financial statements",
-    "internal control",
-    "material weakness",
-    "fraud",
-    "audit",
-    "compliance",
-    "whistleblow",
-]
-
-# Severity mapping for local rules
-RULE_SEVERITY = {
-    "gdpr_pii": "high",
-    "gdpr_sensitive": "high",
-    "sox_keyword": "medium",
-}
+# Local GDPR/SOX rules live in versioned rule packs (see rule_packs.py and packs/).
+# Imported both as `main` (Lambda zip root) and as `src.agents.compliance.main` (local scripts).
+try:
+    from .rule_packs import configured_pack_names, load_rule_pack, scan_text
+    from .scan_budget import ScanBudget, budgeted_mode_enabled
+except ImportError:
+    from rule_packs import configured_pack_names, load_rule_pack, scan_text  # type: ignore
+    from scan_budget import ScanBudget, budgeted_mode_enabled  # type: ignore
 
 
 def _safe_bedrock_client():
@@ -150,47 +128,28 @@ def _call_bedrock_for_checks(text: str, model: Optional[str] = None) -> Dict[str
             return {"bedrock_ok": False, "error": str(last_err) if last_err else "no models tried"}
 
 
-def _local_pii_checks(text: str) -> List[Dict[str, Any]]:
-    print("Entering _local_pii_checks")
-    findings: List[Dict[str, Any]] = []
-    # Check each PII pattern and capture small examples
-    for kind, pattern in PII_PATTERNS.items():
-        for match in pattern.finditer(text):
-            snippet = match.group(0)
-            findings.append(
-                {
-                    "rule_id": "gdpr_pii",
-                    "type": kind,
-                    "match": snippet,
-                    "severity": RULE_SEVERITY.get("gdpr_pii", "high"),
-                }
-            )
-            # Do not flood: capture up to a few
-            if len([f for f in findings if f.get("type") == kind]) >= 10:
-                break
-    return findings
+def _local_rule_checks(
+    text: str, pack_names: List[str], budget: Optional[ScanBudget] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, str], List[Dict[str, str]]]:
+    """Load and scan each rule pack on its own, so one bad pack cannot hide the others.
 
-
-def _local_sox_checks(text: str) -> List[Dict[str, Any]]:
-    print("Entering _local_sox_checks")
+    Returns (findings, {pack name: version} for packs that ran, failed packs).
+    """
+    print("Entering _local_rule_checks")
     findings: List[Dict[str, Any]] = []
-    lowtext = text.lower()
-    for kw in SOX_KEYWORDS:
-        if kw in lowtext:
-            # capture short context near first occurrence
-            idx = lowtext.find(kw)
-            start = max(0, idx - 40)
-            end = min(len(text), idx + len(kw) + 40)
-            snippet = text[start:end].strip()
-            findings.append(
-                {
-                    "rule_id": "sox_keyword",
-                    "keyword": kw,
-                    "match": snippet,
-                    "severity": RULE_SEVERITY.get("sox_keyword", "medium"),
-                }
-            )
-    return findings
+    versions: Dict[str, str] = {}
+    failed: List[Dict[str, str]] = []
+    for name in pack_names:
+        try:
+            pack = load_rule_pack(name)
+            found = scan_text(text, pack, budget)
+        except Exception as e:
+            logger.exception("Rule pack %s failed", name)
+            failed.append({"name": name, "error": f"{type(e).__name__}: {e}"})
+            continue
+        findings.extend(found)
+        versions[pack["name"]] = pack["version"]
+    return findings, versions, failed
 
 
 def _summarize_findings(findings: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -270,11 +229,19 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             logger.warning("Bedrock check failed, falling back to local rules: %s", e)
 
     # Always run local rules (they can complement or serve as fallback)
-    try:
-        findings.extend(_local_pii_checks(text))
-        findings.extend(_local_sox_checks(text))
-    except Exception:
-        logger.exception("Local checks failed")
+    # SCAN_MODE=budgeted enforces per-rule / per-document CPU-time budgets
+    budget = ScanBudget.from_env() if budgeted_mode_enabled() else None
+    pack_names = configured_pack_names()
+    local_findings, rule_packs, rule_packs_failed = _local_rule_checks(text, pack_names, budget)
+    findings.extend(local_findings)
+    if pack_names and not rule_packs:
+        # No local rules ran at all; an empty "ok" would read as a clean document
+        msg = "All rule packs failed: " + ", ".join(f"{f['name']} ({f['error']})" for f in rule_packs_failed)
+        logger.error(msg)
+        return {"status": "error", "message": msg, "contract_id": contract_id, "rule_packs_failed": rule_packs_failed}
+    scan = budget.summary() if budget else {"mode": "fast"}
+    if scan.get("degraded"):
+        logger.warning("Local scan for %s was degraded by its CPU-time budget", contract_id)
 
     summary = _summarize_findings(findings)
 
@@ -284,6 +251,9 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         "s3": {"bucket": bucket, "key": key},
         "findings": findings,
         "summary": summary,
+        "rule_packs": rule_packs,
+        "rule_packs_failed": rule_packs_failed,
+        "scan": scan,
         "bedrock_used": bedrock_used,
         "bedrock_response": bedrock_resp,
     }
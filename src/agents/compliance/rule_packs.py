@@ -0,0 +1,296 @@
+# Versioned rule packs for the local compliance checks.
+#
+# A rule pack is a JSON document (one per regulation) living in `packs/`:
+#
+#   {
+#     "name": "gdpr",
+#     "version": "1.0.0",
+#     "regulation": "GDPR",
+#     "rules": [
+#       {"id": "email", "rule_id": "gdpr_pii", "type": "regex",
+#        "pattern": "...", "severity": "high", "max_matches": 10, "budget_ms": 500},
+#       {"id": "financial_controls", "rule_id": "sox_keyword", "type": "keyword",
+#        "keywords": ["revenue", ...], "severity": "medium", "context_chars": 40}
+#     ]
+#   }
+#
+# `src/scripts/build_rule_packs.py` is a validation-only build step: it rejects
+# malformed packs at build time and writes `<name>.compiled.json`, which is just
+# the validated pack with keywords lowercased. Python cannot serialize compiled
+# regexes, so the artifact saves no regex compilation; loading it only skips
+# re-validating the pack. Deployments ship the artifacts without the sources,
+# and then no source hashing happens either. When both are present (local
+# development) a source whose hash no longer matches its artifact is
+# recompiled from source.
+#
+# The Lambda loads packs lazily by name and memoizes them for the lifetime of
+# the container, so warm invocations never re-read or re-compile a pack.
+
+import os
+import re
+import json
+import hashlib
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from .scan_budget import ScanBudget
+except ImportError:
+    from scan_budget import ScanBudget  # type: ignore
+
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
+# Bump when the layout of compiled artifacts changes; stale artifacts are rebuilt on load
+ARTIFACT_FORMAT = 3
+
+DEFAULT_PACK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "packs")
+DEFAULT_PACKS = ("gdpr", "sox")
+
+SOURCE_SUFFIX = ".json"
+COMPILED_SUFFIX = ".compiled.json"
+
+RULE_TYPES = ("regex", "keyword")
+SEVERITIES = ("high", "medium", "low")
+
+# Loaded packs keyed by (pack_dir, name); survives across warm Lambda invocations
+_PACK_CACHE: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+
+def _is_positive_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+def _validate_pack(source: Dict[str, Any]) -> None:
+    """Raise ValueError if a rule pack source document is malformed."""
+    if not isinstance(source, dict):
+        raise ValueError("Rule pack must be a JSON object")
+    for field in ("name", "version", "rules"):
+        if not source.get(field):
+            raise ValueError(f"Rule pack is missing required field '{field}'")
+    if not isinstance(source["rules"], list) or not all(isinstance(r, dict) for r in source["rules"]):
+        raise ValueError(f"Rule pack {source['name']} 'rules' must be a list of objects")
+    seen = set()
+    for rule in source["rules"]:
+        rid = rule.get("id")
+        if not rid or not isinstance(rid, str):
+            raise ValueError(f"Rule pack {source['name']} has a rule without a string 'id'")
+        if rid in seen:
+            raise ValueError(f"Rule pack {source['name']} has duplicate rule id '{rid}'")
+        seen.add(rid)
+        if not rule.get("rule_id"):
+            raise ValueError(f"Rule {source['name']}/{rid} is missing 'rule_id'")
+        if rule.get("type") not in RULE_TYPES:
+            raise ValueError(f"Rule {source['name']}/{rid} has unknown type {rule.get('type')!r}")
+        if rule.get("severity", "low") not in SEVERITIES:
+            raise ValueError(f"Rule {source['name']}/{rid} has unknown severity {rule.get('severity')!r}")
+        budget_ms = rule.get("budget_ms")
+        if budget_ms is not None and (
+            not isinstance(budget_ms, (int, float)) or isinstance(budget_ms, bool) or budget_ms <= 0
+        ):
+            raise ValueError(f"Rule {source['name']}/{rid} has an invalid budget_ms {budget_ms!r}")
+        for field in ("max_matches", "context_chars"):
+            if field in rule and not _is_positive_int(rule[field]):
+                raise ValueError(f"Rule {source['name']}/{rid} '{field}' must be a positive integer, got {rule[field]!r}")
+        if rule["type"] == "regex":
+            pattern = rule.get("pattern")
+            if not pattern or not isinstance(pattern, str):
+                raise ValueError(f"Rule {source['name']}/{rid} is missing a string 'pattern'")
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"Rule {source['name']}/{rid} has an invalid pattern: {e}") from e
+        else:
+            keywords = rule.get("keywords")
+            if (
+                not isinstance(keywords, list)
+                or not keywords
+                or not all(isinstance(kw, str) and kw for kw in keywords)
+            ):
+                raise ValueError(f"Rule {source['name']}/{rid} 'keywords' must be a non-empty list of non-empty strings")
+
+
+def compile_rule_pack(source: Dict[str, Any], source_sha256: str = "") -> Dict[str, Any]:
+    """Compile a rule pack source document into a ready-to-load artifact."""
+    _validate_pack(source)
+    rules: List[Dict[str, Any]] = []
+    for rule in source["rules"]:
+        compiled = dict(rule)
+        compiled.setdefault("severity", "low")
+        if rule["type"] == "keyword":
+            compiled["keywords"] = [kw.lower() for kw in rule["keywords"]]
+        rules.append(compiled)
+
+    return {
+        "format": ARTIFACT_FORMAT,
+        "name": source["name"],
+        "version": str(source["version"]),
+        "regulation": source.get("regulation", ""),
+        "source_sha256": source_sha256,
+        "rules": rules,
+    }
+
+
+def _sha256_file(path: str) -> str:
+    with open(path, "rb") as fh:
+        return hashlib.sha256(fh.read()).hexdigest()
+
+
+def compile_rule_pack_file(source_path: str, out_dir: Optional[str] = None) -> str:
+    """Compile the pack at `source_path` and write `<name>.compiled.json`.
+
+    Returns the path of the written artifact.
+    """
+    with open(source_path, "r", encoding="utf-8") as fh:
+        source = json.load(fh)
+    artifact = compile_rule_pack(source, _sha256_file(source_path))
+    out_dir = out_dir or os.path.dirname(os.path.abspath(source_path))
+    out_path = os.path.join(out_dir, artifact["name"] + COMPILED_SUFFIX)
+    with open(out_path, "w", encoding="utf-8") as fh:
+        json.dump(artifact, fh, separators=(",", ":"))
+    return out_path
+
+
+def _materialize(artifact: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a compiled artifact into an in-memory pack with compiled regexes."""
+    pack = dict(artifact)
+    pack["regexes"] = {
+        rule["id"]: re.compile(rule["pattern"]) for rule in artifact["rules"] if rule["type"] == "regex"
+    }
+    return pack
+
+
+def _read_artifact(name: str, pack_dir: str) -> Dict[str, Any]:
+    source_path = os.path.join(pack_dir, name + SOURCE_SUFFIX)
+    compiled_path = os.path.join(pack_dir, name + COMPILED_SUFFIX)
+    has_source = os.path.exists(source_path)
+
+    if os.path.exists(compiled_path):
+        with open(compiled_path, "r", encoding="utf-8") as fh:
+            artifact = json.load(fh)
+        if artifact.get("format") != ARTIFACT_FORMAT:
+            if not has_source:
+                raise ValueError(f"Compiled rule pack {compiled_path} has an old format; rebuild it")
+            logger.warning("Compiled rule pack %s has an old format, compiling from source", compiled_path)
+        # Only hash the source when it was shipped alongside the artifact
+        elif not has_source or artifact.get("source_sha256") == _sha256_file(source_path):
+            return artifact
+        else:
+            logger.warning("Compiled rule pack %s is stale, compiling from source", compiled_path)
+
+    if not has_source:
+        raise FileNotFoundError(f"Rule pack '{name}' not found in {pack_dir}")
+    logger.info("No up-to-date compiled artifact for rule pack %s, compiling from source", name)
+    with open(source_path, "r", encoding="utf-8") as fh:
+        source = json.load(fh)
+    return compile_rule_pack(source)
+
+
+def load_rule_pack(name: str, pack_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Load a rule pack by name, memoized across invocations."""
+    pack_dir = os.path.abspath(pack_dir or os.environ.get("RULE_PACK_DIR") or DEFAULT_PACK_DIR)
+    cache_key = (pack_dir, name)
+    pack = _PACK_CACHE.get(cache_key)
+    if pack is None:
+        pack = _materialize(_read_artifact(name, pack_dir))
+        _PACK_CACHE[cache_key] = pack
+        logger.info("Loaded rule pack %s@%s", pack["name"], pack["version"])
+    return pack
+
+
+def configured_pack_names() -> List[str]:
+    """Pack names from the RULE_PACKS env var (comma separated), or the defaults."""
+    raw = os.environ.get("RULE_PACKS")
+    if not raw:
+        return list(DEFAULT_PACKS)
+    return [n.strip() for n in raw.split(",") if n.strip()]
+
+
+def load_rule_packs(names: Optional[List[str]] = None, pack_dir: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Load several packs by name (defaults to `configured_pack_names()`)."""
+    return [load_rule_pack(n, pack_dir) for n in (names or configured_pack_names())]
+
+
+def _regex_findings(
+    text: str,
+    pack: Dict[str, Any],
+    rule: Dict[str, Any],
+    findings: List[Dict[str, Any]],
+    check: Optional[Callable[[], None]] = None,
+) -> None:
+    """Append findings for a regex rule; `findings` keeps partial results if the rule is cut off."""
+    cap = rule.get("max_matches")
+    for match in pack["regexes"][rule["id"]].finditer(text):
+        findings.append(
+            {
+                "rule_id": rule["rule_id"],
+                "type": rule["id"],
+                "match": match.group(0),
+                "severity": rule["severity"],
+            }
+        )
+        # Do not flood: capture up to the rule cap
+        if cap and len(findings) >= cap:
+            break
+        if check:
+            check()
+
+
+def _keyword_findings(
+    text: str,
+    lowtext: str,
+    rule: Dict[str, Any],
+    findings: List[Dict[str, Any]],
+    check: Optional[Callable[[], None]] = None,
+) -> None:
+    """Append findings for a keyword rule (first occurrence of each keyword)."""
+    cap = rule.get("max_matches")
+    context = rule.get("context_chars", 40)
+    for kw in rule["keywords"]:
+        # str.find is a C-level substring search: one fast pass per keyword
+        idx = lowtext.find(kw)
+        if idx >= 0:
+            # capture short context near first occurrence
+            start = max(0, idx - context)
+            end = min(len(text), idx + len(kw) + context)
+            findings.append(
+                {
+                    "rule_id": rule["rule_id"],
+                    "keyword": kw,
+                    "match": text[start:end].strip(),
+                    "severity": rule["severity"],
+                }
+            )
+            if cap and len(findings) >= cap:
+                break
+        if check:
+            check()
+
+
+def scan_text(text: str, pack: Dict[str, Any], budget: Optional[ScanBudget] = None) -> List[Dict[str, Any]]:
+    """Apply every rule in `pack` to `text`, in pack order.
+
+    Each finding is tagged with the `rule_pack` (name@version) that produced it.
+    With a `budget`, every rule runs under its CPU-time budget and its elapsed
+    time and match count are recorded on the budget (see scan_budget.py).
+    """
+    tag = f"{pack['name']}@{pack['version']}"
+    check = budget.check if budget else None
+    lowtext = text.lower() if any(r["type"] == "keyword" for r in pack["rules"]) else ""
+
+    findings: List[Dict[str, Any]] = []
+    for rule in pack["rules"]:
+        found: List[Dict[str, Any]] = []
+        if rule["type"] == "regex":
+            fn = lambda: _regex_findings(text, pack, rule, found, check)  # noqa: E731
+        else:
+            fn = lambda: _keyword_findings(text, lowtext, rule, found, check)  # noqa: E731
+        if budget is None:
+            fn()
+        else:
+            stats = budget.run(tag, rule["id"], rule["type"], fn, rule.get("budget_ms"))
+            stats["matches"] = len(found)
+        for f in found:
+            f["rule_pack"] = tag
+        findings.extend(found)
+    return findings
@@ -0,0 +1,141 @@
+# CPU-time budgets for the local rule scanner.
+#
+# Some rule-pack regexes backtrack heavily on long digit/punctuation runs (e.g.
+# malformed OCR pages), which can stall an invocation until the Lambda timeout.
+# In budgeted mode every rule runs under its own CPU-time budget, capped by what
+# is left of the per-document budget. A rule that runs over is cut off (its
+# partial findings are kept), rules that no longer fit in the document budget
+# are skipped, and both are flagged in the scan stats.
+#
+# On the main thread the budget is enforced with an ITIMER_PROF timer. The
+# regex engine only notices the signal at its periodic signal checks, which
+# come every few thousand search start positions, so the cut-off lands up to
+# that many match attempts late. For a pattern with bounded quantifiers each
+# attempt costs O(1) and the overshoot is small. For an unbounded `+`/`*` that
+# has to fail (e.g. `[a-z]+@` on a long run without an '@') each attempt costs
+# O(n) and the overshoot grows with the text: with a 200 ms budget such a rule
+# was measured running ~1 s at 50k chars, ~4 s at 200k and ~8 s at 400k. The
+# document budget is only checked between rules and does not bound this, so
+# pack patterns must keep their quantifiers bounded (see packs/gdpr.json).
+#
+# Off the main thread (signals are main-thread only) budgets fall back to
+# cooperative checks between matches, which cannot stop a single long match
+# attempt; a rule that finishes past its budget that way is flagged as an
+# overrun.
+
+import os
+import time
+import signal
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
+DEFAULT_RULE_BUDGET_MS = 1000.0
+DEFAULT_DOCUMENT_BUDGET_MS = 10000.0
+
+
+class BudgetExceeded(Exception):
+    """Raised inside a rule when it runs past its CPU-time budget."""
+
+
+def budgeted_mode_enabled() -> bool:
+    """True when SCAN_MODE=budgeted is set in the environment."""
+    return os.environ.get("SCAN_MODE", "fast").lower() == "budgeted"
+
+
+class ScanBudget:
+    """Per-document CPU-time budget; records per-rule elapsed time and match counts."""
+
+    def __init__(self, rule_ms: float = DEFAULT_RULE_BUDGET_MS, document_ms: float = DEFAULT_DOCUMENT_BUDGET_MS):
+        self.rule_ms = float(rule_ms)
+        self.document_ms = float(document_ms)
+        self.spent_ms = 0.0
+        self.rules: List[Dict[str, Any]] = []
+        self._deadline: Optional[float] = None
+        self._armed = False
+
+    @classmethod
+    def from_env(cls) -> "ScanBudget":
+        """Build a budget from RULE_BUDGET_MS / DOCUMENT_BUDGET_MS."""
+        return cls(
+            rule_ms=float(os.environ.get("RULE_BUDGET_MS") or DEFAULT_RULE_BUDGET_MS),
+            document_ms=float(os.environ.get("DOCUMENT_BUDGET_MS") or DEFAULT_DOCUMENT_BUDGET_MS),
+        )
+
+    def check(self) -> None:
+        """Cooperative checkpoint; raises BudgetExceeded once the active rule is over budget."""
+        if self._deadline is not None and time.thread_time() > self._deadline:
+            raise BudgetExceeded()
+
+    def _on_timer(self, signum: int, frame: Any) -> None:
+        if self._armed:
+            raise BudgetExceeded()
+
+    def run(
+        self,
+        pack: str,
+        rule: str,
+        rule_type: str,
+        fn: Callable[[], Any],
+        budget_ms: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Run `fn` for one rule under its budget and return the rule's stats entry.
+
+        The caller fills in `matches` on the returned entry.
+        """
+        stats: Dict[str, Any] = {
+            "pack": pack,
+            "rule": rule,
+            "type": rule_type,
+            "elapsed_ms": 0.0,
+            "matches": 0,
+            "status": "ok",
+        }
+        self.rules.append(stats)
+
+        limit_ms = min(budget_ms or self.rule_ms, self.document_ms - self.spent_ms)
+        if limit_ms <= 0:
+            stats["status"] = "skipped"
+            logger.warning("Document scan budget exhausted, skipping rule %s/%s", pack, rule)
+            return stats
+
+        use_timer = hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+        previous = None
+        start = time.thread_time()
+        self._deadline = start + limit_ms / 1000.0
+        try:
+            if use_timer:
+                previous = signal.signal(signal.SIGPROF, self._on_timer)
+                self._armed = True
+                signal.setitimer(signal.ITIMER_PROF, limit_ms / 1000.0)
+            fn()
+        except BudgetExceeded:
+            stats["status"] = "cutoff"
+            logger.warning("Rule %s/%s exceeded its %.0f ms budget and was cut off", pack, rule, limit_ms)
+        finally:
+            # Disarm before cancelling the timer so a late SIGPROF is ignored
+            self._armed = False
+            self._deadline = None
+            if use_timer:
+                signal.setitimer(signal.ITIMER_PROF, 0)
+                signal.signal(signal.SIGPROF, previous if previous is not None else signal.SIG_DFL)
+            elapsed_ms = (time.thread_time() - start) * 1000.0
+            stats["elapsed_ms"] = round(elapsed_ms, 3)
+            self.spent_ms += elapsed_ms
+        if stats["status"] == "ok" and elapsed_ms > limit_ms:
+            stats["status"] = "overrun"
+            logger.warning("Rule %s/%s ran %.0f ms past its %.0f ms budget", pack, rule, elapsed_ms - limit_ms, limit_ms)
+        return stats
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "mode": "budgeted",
+            "rule_budget_ms": self.rule_ms,
+            "document_budget_ms": self.document_ms,
+            "elapsed_ms": round(self.spent_ms, 3),
+            "degraded": any(r["status"] != "ok" for r in self.rules),
+            "rules": self.rules,
+        }
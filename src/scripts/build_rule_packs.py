@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Build step: validate compliance rule packs and write their deployable artifacts.
+
+Every `<name>.json` pack in the pack directory is validated and written next to
+it as `<name>.compiled.json` (the validated pack with keywords lowercased).
+This is a validation step: a malformed pack fails the build instead of failing
+at runtime. The compliance Lambda loads the artifacts at cold start without
+re-validating them. Run this before zipping the compliance agent for
+deployment.
+
+Usage:
+  python src/scripts/build_rule_packs.py [--pack-dir DIR] [--out-dir DIR] [name ...]
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Make repo root importable so `src` package can be resolved
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.agents.compliance.rule_packs import (  # noqa: E402
+    COMPILED_SUFFIX,
+    DEFAULT_PACK_DIR,
+    SOURCE_SUFFIX,
+    compile_rule_pack_file,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*", help="pack names to build (default: all packs in --pack-dir)")
+    parser.add_argument("--pack-dir", default=DEFAULT_PACK_DIR, help="directory holding <name>.json packs")
+    parser.add_argument("--out-dir", default=None, help="where to write artifacts (default: --pack-dir)")
+    args = parser.parse_args()
+
+    pack_dir = Path(args.pack_dir)
+    if args.names:
+        sources = [pack_dir / (n + SOURCE_SUFFIX) for n in args.names]
+    else:
+        sources = sorted(p for p in pack_dir.glob("*" + SOURCE_SUFFIX) if not p.name.endswith(COMPILED_SUFFIX))
+
+    if not sources:
+        print(f"No rule packs found in {pack_dir}", file=sys.stderr)
+        return 1
+
+    for source in sources:
+        try:
+            out_path = compile_rule_pack_file(str(source), args.out_dir)
+        except (OSError, ValueError) as e:
+            print(f"Failed to build {source}:\n", e, file=sys.stderr)
+            return 1
+        print(f"Built {source.name} -> {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Profile compliance rule-pack rules over a sample corpus and rank them by cost.
+
+Each document is scanned in budgeted mode (see src/agents/compliance/scan_budget.py)
+and per-rule CPU time, match counts, cut-offs and skips are aggregated across
+the corpus. Corpus entries may be plain text files, ingestion/compliance JSON
+payloads with an `extracted_text` field, or directories of either.
+
+Usage:
+  python src/scripts/profile_rules.py corpus/ [more files ...]
+      [--packs gdpr,sox] [--rule-budget-ms 1000] [--document-budget-ms 10000] [--top 20]
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Make repo root importable so `src` package can be resolved
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.agents.compliance.rule_packs import configured_pack_names, load_rule_packs, scan_text  # noqa: E402
+from src.agents.compliance.scan_budget import (  # noqa: E402
+    DEFAULT_DOCUMENT_BUDGET_MS,
+    DEFAULT_RULE_BUDGET_MS,
+    ScanBudget,
+)
+
+
+def iter_corpus(paths: List[str]) -> Iterator[Tuple[str, str]]:
+    """Yield (name, text) for every document under `paths`."""
+    for raw in paths:
+        path = Path(raw)
+        files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+        for f in files:
+            content = f.read_text(encoding="utf-8", errors="ignore")
+            if f.suffix == ".json":
+                try:
+                    content = json.loads(content).get("extracted_text") or ""
+                except (ValueError, AttributeError):
+                    print(f"Skipping {f}: not an ingestion payload", file=sys.stderr)
+                    continue
+            yield str(f), content
+
+
+def profile(
+    docs: Iterator[Tuple[str, str]], packs: List[Dict[str, Any]], rule_ms: float, document_ms: float
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """Scan every document and aggregate per-rule stats, most expensive first."""
+    totals: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    n_docs = 0
+    for name, text in docs:
+        n_docs += 1
+        budget = ScanBudget(rule_ms=rule_ms, document_ms=document_ms)
+        for pack in packs:
+            scan_text(text, pack, budget)
+        for r in budget.rules:
+            agg = totals.setdefault(
+                (r["pack"], r["rule"]),
+                {"pack": r["pack"], "rule": r["rule"], "type": r["type"], "total_ms": 0.0, "max_ms": 0.0,
+                 "max_doc": "", "matches": 0, "cutoff": 0, "skipped": 0},
+            )
+            agg["total_ms"] += r["elapsed_ms"]
+            agg["matches"] += r["matches"]
+            if r["elapsed_ms"] > agg["max_ms"]:
+                agg["max_ms"] = r["elapsed_ms"]
+                agg["max_doc"] = name
+            if r["status"] in ("cutoff", "skipped"):
+                agg[r["status"]] += 1
+    ranked = sorted(totals.values(), key=lambda a: a["total_ms"], reverse=True)
+    return n_docs, ranked
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("corpus", nargs="+", help="text/JSON files or directories to scan")
+    parser.add_argument("--packs", default=",".join(configured_pack_names()), help="comma separated pack names")
+    parser.add_argument("--rule-budget-ms", type=float, default=DEFAULT_RULE_BUDGET_MS)
+    parser.add_argument("--document-budget-ms", type=float, default=DEFAULT_DOCUMENT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=20, help="number of rules to show")
+    parser.add_argument("--json", action="store_true", help="print the ranking as JSON")
+    args = parser.parse_args()
+
+    missing = [p for p in args.corpus if not Path(p).exists()]
+    if missing:
+        print(f"Corpus path not found: {', '.join(missing)}", file=sys.stderr)
+        return 1
+
+    packs = load_rule_packs([n.strip() for n in args.packs.split(",") if n.strip()])
+    n_docs, ranked = profile(iter_corpus(args.corpus), packs, args.rule_budget_ms, args.document_budget_ms)
+    if not n_docs:
+        print("No documents found in corpus", file=sys.stderr)
+        return 1
+
+    ranked = ranked[: args.top]
+    if args.json:
+        print(json.dumps({"n_documents": n_docs, "rules": ranked}, indent=2))
+        return 0
+
+    print(f"Profiled {n_docs} documents")
+    print(f"{'pack':<14} {'rule':<22} {'total_ms':>10} {'avg_ms':>8} {'max_ms':>9} {'matches':>8} {'cutoff':>7} {'skipped':>8}  slowest document")
+    for a in ranked:
+        print(
+            f"{a['pack']:<14} {a['rule']:<22} {a['total_ms']:>10.1f} {a['total_ms'] / n_docs:>8.2f} "
+            f"{a['max_ms']:>9.1f} {a['matches']:>8} {a['cutoff']:>7} {a['skipped']:>8}  {a['max_doc']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
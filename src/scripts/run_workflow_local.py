@@ -0,0 +1,665 @@
+#!/usr/bin/env python3
+"""In-process executor for src/infra/step-functions/definition.asl.json.
+
+Interprets the state machine locally and invokes the Python Lambda handlers
+directly (no Terraform deploy, no Step Functions service), so the full
+Ingestion -> Compliance -> PrepareOutput pipeline can be run and load-tested
+on a laptop. Reports per-state latency and payload sizes and fails a run with
+States.DataLimitExceeded when a state's output exceeds the 256 KiB Step
+Functions payload limit.
+
+Supported ASL: Task (lambda:invoke integration and direct function
+resources), Pass, Succeed, Fail; InputPath, Parameters, ResultSelector,
+ResultPath, OutputPath, Retry and Catch; the `$$` context object and the
+States.Format / States.JsonToString / States.StringToJson intrinsics.
+
+Lambda resources are resolved by their template variable name
+(`${INGESTION_LAMBDA}`, `${COMPLIANCE_LAMBDA}`). By default they call the real
+handlers; override with `--handler NAME=module:function`, or
+`--handler NAME=@payload.json` to return a canned payload (e.g. a saved
+ingestion result, to load-test compliance without S3/Textract).
+
+Usage:
+  python src/scripts/run_workflow_local.py [--input event.json]
+      [--executions 50] [--concurrency 8] [--processes] [--time-scale 0]
+      [--handler INGESTION_LAMBDA=@ingestion_output.json] [--quiet] [--json]
+"""
+
+import io
+import os
+import re
+import math
+import sys
+import json
+import time
+import uuid
+import argparse
+import importlib
+import contextlib
+import multiprocessing.util
+from pathlib import Path
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Make repo root importable so `src` package can be resolved
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+DEFINITION_PATH = ROOT / "src" / "infra" / "step-functions" / "definition.asl.json"
+
+DEFAULT_HANDLERS = {
+    "INGESTION_LAMBDA": "src.agents.ingestion.main:handler",
+    "COMPLIANCE_LAMBDA": "src.agents.compliance.main:handler",
+}
+
+# Same sample event as trigger_ingestion_local.py
+DEFAULT_EVENT = {
+    "contract_id": "",
+    "s3": {"bucket": "agentic-compliance-workflow-dev-s3-artifacts", "key": "contracts/contract.pdf"},
+}
+
+LAMBDA_INVOKE = "arn:aws:states:::lambda:invoke"
+
+# Step Functions limit for state input/output and execution input
+MAX_PAYLOAD_BYTES = 262144
+
+# Errors that end the execution and cannot be matched by Retry/Catch
+TERMINAL_ERRORS = ("States.Runtime", "States.DataLimitExceeded")
+
+
+class StatesError(Exception):
+    """An ASL error (`Error` name plus `Cause`) raised while running a state."""
+
+    def __init__(self, error: Optional[str], cause: Optional[str] = ""):
+        super().__init__(f"{error}: {cause}" if cause else str(error))
+        self.error = error
+        self.cause = cause
+
+    @property
+    def label(self) -> str:
+        """Name to report the error under; a Fail state may define neither Error nor Cause."""
+        return self.error or self.cause or "<no Error>"
+
+
+def _payload_bytes(data: Any) -> int:
+    return len(json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+
+def _json_copy(data: Any) -> Any:
+    """Round-trip through JSON, as every state/Lambda boundary does in the real service."""
+    return json.loads(json.dumps(data))
+
+
+# --- JSONPath ---------------------------------------------------------------
+
+_PATH_TOKEN = re.compile(r"\.([^.\[\]]+)|\[(\d+)\]")
+
+
+def _path_tokens(path: str) -> List[Any]:
+    if not path.startswith("$"):
+        raise StatesError("States.Runtime", f"Invalid path {path!r}")
+    tokens: List[Any] = []
+    pos = 1
+    while pos < len(path):
+        m = _PATH_TOKEN.match(path, pos)
+        if not m:
+            raise StatesError("States.Runtime", f"Unsupported path {path!r}")
+        tokens.append(m.group(1) if m.group(1) is not None else int(m.group(2)))
+        pos = m.end()
+    return tokens
+
+
+def get_path(data: Any, path: str, context: Optional[Dict[str, Any]] = None) -> Any:
+    """Evaluate a reference path (`$.a.b[0]`, or `$$.x` against the context object)."""
+    if path.startswith("$$"):
+        data, path = context or {}, path[1:]
+    cur = data
+    for tok in _path_tokens(path):
+        try:
+            cur = cur[tok]
+        except (KeyError, IndexError, TypeError):
+            raise StatesError("States.Runtime", f"The JSONPath {path!r} could not be found in the input")
+    return cur
+
+
+def set_path(data: Any, path: Optional[str], value: Any) -> Any:
+    """Apply a ResultPath: insert `value` into a copy of `data` at `path`."""
+    if path is None:
+        return data
+    tokens = _path_tokens(path)
+    if not tokens:
+        return value
+    out = _json_copy(data) if isinstance(data, dict) else {}
+    cur = out
+    for tok in tokens[:-1]:
+        if not isinstance(cur.get(tok), dict):
+            cur[tok] = {}
+        cur = cur[tok]
+    cur[tokens[-1]] = value
+    return out
+
+
+# --- Intrinsic functions ----------------------------------------------------
+
+def _split_args(raw: str) -> List[str]:
+    args: List[str] = []
+    depth, quoted, escaped, start = 0, False, False, 0
+    for i, ch in enumerate(raw):
+        if escaped:
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif ch == "'":
+            quoted = not quoted
+        elif not quoted and ch == "(":
+            depth += 1
+        elif not quoted and ch == ")":
+            depth -= 1
+        elif not quoted and depth == 0 and ch == ",":
+            args.append(raw[start:i].strip())
+            start = i + 1
+    if raw.strip():
+        args.append(raw[start:].strip())
+    return args
+
+
+def _eval_arg(arg: str, data: Any, context: Dict[str, Any]) -> Any:
+    if arg.startswith("'") and arg.endswith("'") and len(arg) >= 2:
+        # Keep \{ \} escapes for States.Format; unescape quotes and backslashes
+        return re.sub(r"\\(['\\])", r"\1", arg[1:-1])
+    if arg.startswith("$"):
+        return get_path(data, arg, context)
+    if arg.startswith("States."):
+        return eval_intrinsic(arg, data, context)
+    try:
+        return json.loads(arg)
+    except ValueError:
+        raise StatesError("States.Runtime", f"Invalid intrinsic function argument {arg!r}")
+
+
+def _format(template: str, values: List[Any]) -> str:
+    out: List[str] = []
+    it = iter(values)
+    i = 0
+    while i < len(template):
+        ch = template[i]
+        if ch == "\\" and i + 1 < len(template) and template[i + 1] in "{}":
+            out.append(template[i + 1])
+            i += 2
+            continue
+        if template.startswith("{}", i):
+            try:
+                value = next(it)
+            except StopIteration:
+                raise StatesError("States.Runtime", "States.Format has more placeholders than arguments")
+            if isinstance(value, (dict, list)):
+                raise StatesError("States.Runtime", "States.Format arguments must be scalar values")
+            out.append(value if isinstance(value, str) else json.dumps(value))
+            i += 2
+            continue
+        out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+def eval_intrinsic(expr: str, data: Any, context: Dict[str, Any]) -> Any:
+    """Evaluate a supported intrinsic function call such as States.Format('{}', $.x)."""
+    m = re.match(r"^(States\.\w+)\((.*)\)$", expr.strip(), re.S)
+    if not m:
+        raise StatesError("States.Runtime", f"Invalid intrinsic function {expr!r}")
+    name = m.group(1)
+    args = [_eval_arg(a, data, context) for a in _split_args(m.group(2))]
+    if name == "States.Format":
+        if not args or not isinstance(args[0], str):
+            raise StatesError("States.Runtime", "States.Format needs a template string")
+        return _format(args[0], args[1:])
+    if name == "States.JsonToString" and len(args) == 1:
+        return json.dumps(args[0], separators=(",", ":"))
+    if name == "States.StringToJson" and len(args) == 1 and isinstance(args[0], str):
+        return json.loads(args[0])
+    raise StatesError("States.Runtime", f"Unsupported intrinsic function {name}")
+
+
+def resolve_template(template: Any, data: Any, context: Dict[str, Any]) -> Any:
+    """Resolve a Parameters / ResultSelector template against `data`."""
+    if isinstance(template, dict):
+        out: Dict[str, Any] = {}
+        for k, v in template.items():
+            if k.endswith(".$"):
+                if not isinstance(v, str):
+                    raise StatesError("States.Runtime", f"Field {k!r} must hold a path or intrinsic function")
+                out[k[:-2]] = eval_intrinsic(v, data, context) if v.startswith("States.") else get_path(data, v, context)
+            else:
+                out[k] = resolve_template(v, data, context)
+        return out
+    if isinstance(template, list):
+        return [resolve_template(v, data, context) for v in template]
+    return template
+
+
+def _effective_input(state: Dict[str, Any], data: Any, context: Dict[str, Any]) -> Any:
+    """Apply InputPath (default `$`; null passes an empty object)."""
+    path = state.get("InputPath", "$")
+    return get_path(data, path, context) if path is not None else {}
+
+
+def _error_matches(error: str, names: List[str]) -> bool:
+    if error in TERMINAL_ERRORS:
+        return False
+    for name in names:
+        if name == error or name == "States.ALL":
+            return True
+        if name == "States.TaskFailed" and error != "States.Timeout":
+            return True
+    return False
+
+
+# --- Handlers ----------------------------------------------------------------
+
+def load_handler(spec: str) -> Callable[[Dict[str, Any], Any], Any]:
+    """`module:function` imports a handler; `@file.json` returns that file's JSON."""
+    if spec.startswith("@"):
+        with open(spec[1:], "r", encoding="utf-8") as fh:
+            canned = json.load(fh)
+        return lambda event, context: _json_copy(canned)
+    module_name, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attr or "handler")
+
+
+class LocalStateMachine:
+    """Runs an ASL definition in-process against local Python handlers."""
+
+    def __init__(
+        self,
+        definition: Dict[str, Any],
+        handlers: Dict[str, Callable[[Dict[str, Any], Any], Any]],
+        time_scale: float = 1.0,
+    ):
+        self.definition = definition
+        self.handlers = handlers
+        self.time_scale = time_scale
+
+    @classmethod
+    def from_file(cls, path: Path = DEFINITION_PATH, **kwargs: Any) -> "LocalStateMachine":
+        with open(path, "r", encoding="utf-8") as fh:
+            return cls(json.load(fh), **kwargs)
+
+    def _invoke(self, resource: str, params: Any) -> Any:
+        if resource == LAMBDA_INVOKE:
+            function_name = (params or {}).get("FunctionName", "")
+            payload = (params or {}).get("Payload", {})
+        else:
+            function_name, payload = resource, params
+        # "${INGESTION_LAMBDA}" -> "INGESTION_LAMBDA"
+        key = re.sub(r"^\$\{(.*)\}$", r"\1", function_name)
+        handler = self.handlers.get(key)
+        if handler is None:
+            raise StatesError("Lambda.ResourceNotFoundException", f"No local handler for {function_name!r}")
+
+        try:
+            result = handler(_json_copy(payload), None)
+        except Exception as e:
+            cause = json.dumps({"errorMessage": str(e), "errorType": type(e).__name__})
+            raise StatesError(type(e).__name__, cause)
+        try:
+            result = _json_copy(result)
+        except (TypeError, ValueError) as e:
+            raise StatesError("Runtime.MarshalError", str(e))
+
+        if resource == LAMBDA_INVOKE:
+            return {"ExecutedVersion": "$LATEST", "Payload": result, "StatusCode": 200}
+        return result
+
+    def _run_task(self, name: str, state: Dict[str, Any], data: Any, context: Dict[str, Any], rec: Dict[str, Any]) -> Tuple[Any, str]:
+        effective = _effective_input(state, data, context)
+        params = resolve_template(state["Parameters"], effective, context) if "Parameters" in state else effective
+
+        retry_counts = [0] * len(state.get("Retry", []))
+        while True:
+            rec["attempts"] += 1
+            context["State"]["RetryCount"] = rec["attempts"] - 1
+            try:
+                result = self._invoke(state["Resource"], params)
+                if "ResultSelector" in state:
+                    result = resolve_template(state["ResultSelector"], result, context)
+                return set_path(data, state.get("ResultPath", "$"), result), state.get("Next", "")
+            except StatesError as e:
+                retrier = next(
+                    (i for i, r in enumerate(state.get("Retry", [])) if _error_matches(e.error, r["ErrorEquals"])),
+                    None,
+                )
+                if retrier is not None:
+                    r = state["Retry"][retrier]
+                    if retry_counts[retrier] < r.get("MaxAttempts", 3):
+                        delay = r.get("IntervalSeconds", 1) * r.get("BackoffRate", 2.0) ** retry_counts[retrier]
+                        if "MaxDelaySeconds" in r:
+                            delay = min(delay, r["MaxDelaySeconds"])
+                        retry_counts[retrier] += 1
+                        time.sleep(delay * self.time_scale)
+                        continue
+                for catcher in state.get("Catch", []):
+                    if _error_matches(e.error, catcher["ErrorEquals"]):
+                        rec["error"] = e.label
+                        error_output = {"Error": e.error, "Cause": e.cause}
+                        return set_path(data, catcher.get("ResultPath", "$"), error_output), catcher["Next"]
+                raise
+
+    def _run_state(self, name: str, state: Dict[str, Any], data: Any, context: Dict[str, Any], rec: Dict[str, Any]) -> Tuple[Any, Optional[str]]:
+        """Run one state; returns (output, next state name or None when the execution ends)."""
+        kind = state.get("Type")
+        if kind == "Fail":
+            # The service reports Error/Cause exactly as set on the state (possibly unset)
+            raise StatesError(state.get("Error"), state.get("Cause"))
+
+        if kind == "Task":
+            output, next_name = self._run_task(name, state, data, context, rec)
+        elif kind in ("Pass", "Succeed"):
+            effective = _effective_input(state, data, context)
+            if kind == "Pass":
+                if "Result" in state:
+                    result = state["Result"]
+                elif "Parameters" in state:
+                    result = resolve_template(state["Parameters"], effective, context)
+                else:
+                    result = effective
+                output = set_path(data, state.get("ResultPath", "$"), result)
+            else:
+                output = effective
+            next_name = state.get("Next", "")
+        else:
+            raise StatesError("States.Runtime", f"Unsupported state type {kind!r} in {name}")
+
+        if "OutputPath" in state:
+            output = get_path(output, state["OutputPath"], context) if state["OutputPath"] is not None else {}
+        if kind == "Succeed" or state.get("End"):
+            next_name = None
+        return output, next_name
+
+    def execute(self, execution_input: Any, name: Optional[str] = None) -> Dict[str, Any]:
+        """Run one execution; returns its status, output/error and per-state records."""
+        name = name or str(uuid.uuid4())
+        started = time.perf_counter()
+        context: Dict[str, Any] = {
+            "Execution": {
+                "Id": f"local:execution:{name}",
+                "Name": name,
+                "Input": execution_input,
+                "StartTime": datetime.now(timezone.utc).isoformat(),
+            },
+            "StateMachine": {"Id": "local:stateMachine", "Name": "local"},
+            "State": {},
+        }
+        execution: Dict[str, Any] = {"name": name, "status": "SUCCEEDED", "output": None, "error": None, "states": []}
+
+        data = execution_input
+        state_name: Optional[str] = self.definition["StartAt"]
+        try:
+            if _payload_bytes(data) > MAX_PAYLOAD_BYTES:
+                raise StatesError("States.DataLimitExceeded", "Execution input exceeds the payload size limit")
+            while state_name is not None:
+                state = self.definition["States"].get(state_name)
+                if state is None:
+                    raise StatesError("States.Runtime", f"State {state_name!r} is not defined")
+                context["State"] = {"Name": state_name, "EnteredTime": datetime.now(timezone.utc).isoformat(), "RetryCount": 0}
+                rec: Dict[str, Any] = {
+                    "state": state_name,
+                    "type": state.get("Type"),
+                    "latency_ms": 0.0,
+                    "input_bytes": _payload_bytes(data),
+                    "output_bytes": 0,
+                    "attempts": 0,
+                    "error": None,
+                }
+                execution["states"].append(rec)
+                entered = time.perf_counter()
+                try:
+                    data, state_name = self._run_state(state_name, state, data, context, rec)
+                except StatesError as e:
+                    rec["error"] = e.label
+                    raise
+                finally:
+                    rec["latency_ms"] = round((time.perf_counter() - entered) * 1000.0, 3)
+                rec["output_bytes"] = _payload_bytes(data)
+                if rec["output_bytes"] > MAX_PAYLOAD_BYTES:
+                    rec["error"] = "States.DataLimitExceeded"
+                    raise StatesError(
+                        "States.DataLimitExceeded",
+                        f"State {rec['state']} output is {rec['output_bytes']} bytes (limit {MAX_PAYLOAD_BYTES})",
+                    )
+            execution["output"] = data
+        except StatesError as e:
+            execution["status"] = "FAILED"
+            execution["error"] = {"Error": e.error, "Cause": e.cause}
+        execution["duration_ms"] = round((time.perf_counter() - started) * 1000.0, 3)
+        return execution
+
+
+# --- Load test report -------------------------------------------------------
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    # nearest-rank percentile
+    idx = max(0, math.ceil(pct / 100.0 * len(ordered)) - 1)
+    return ordered[idx]
+
+
+def summarize(executions: List[Dict[str, Any]], wall_s: float, runner: str = "sequential") -> Dict[str, Any]:
+    """Aggregate per-state latency and payload sizes across executions.
+
+    `runner` is how the executions were run ("sequential", "threads" or
+    "processes"); threaded latencies are labelled as not Lambda-like.
+    """
+    per_state: Dict[str, Dict[str, Any]] = {}
+    for ex in executions:
+        for rec in ex["states"]:
+            agg = per_state.setdefault(
+                rec["state"], {"state": rec["state"], "type": rec["type"], "latencies": [], "in": [], "out": [], "errors": 0, "retries": 0}
+            )
+            agg["latencies"].append(rec["latency_ms"])
+            agg["in"].append(rec["input_bytes"])
+            agg["out"].append(rec["output_bytes"])
+            agg["retries"] += max(0, rec["attempts"] - 1)
+            if rec["error"]:
+                agg["errors"] += 1
+
+    states = []
+    for agg in per_state.values():
+        lat = agg["latencies"]
+        states.append(
+            {
+                "state": agg["state"],
+                "type": agg["type"],
+                "count": len(lat),
+                "p50_ms": round(_percentile(lat, 50), 3),
+                "p95_ms": round(_percentile(lat, 95), 3),
+                "max_ms": round(max(lat), 3),
+                "avg_input_bytes": int(sum(agg["in"]) / len(lat)),
+                "max_input_bytes": max(agg["in"]),
+                "avg_output_bytes": int(sum(agg["out"]) / len(lat)),
+                "max_output_bytes": max(agg["out"]),
+                "errors": agg["errors"],
+                "retries": agg["retries"],
+            }
+        )
+
+    durations = [ex["duration_ms"] for ex in executions]
+    failures: Dict[str, int] = {}
+    for ex in executions:
+        if ex["error"]:
+            label = ex["error"]["Error"] or ex["error"]["Cause"] or "<no Error>"
+            failures[label] = failures.get(label, 0) + 1
+    latency_note = None
+    if runner == "threads":
+        latency_note = (
+            "executions ran on threads and contend for the GIL, so per-state latencies are "
+            "inflated and not Lambda-like; use --processes for isolated timings"
+        )
+    return {
+        "runner": runner,
+        "latency_note": latency_note,
+        "executions": len(executions),
+        "succeeded": sum(1 for ex in executions if ex["status"] == "SUCCEEDED"),
+        "failed": sum(1 for ex in executions if ex["status"] == "FAILED"),
+        "failures": failures,
+        "wall_s": round(wall_s, 3),
+        "throughput_per_s": round(len(executions) / wall_s, 3) if wall_s > 0 else 0.0,
+        "p50_ms": round(_percentile(durations, 50), 3),
+        "p95_ms": round(_percentile(durations, 95), 3),
+        "payload_limit_bytes": MAX_PAYLOAD_BYTES,
+        "states": states,
+    }
+
+
+def run_load(machine: LocalStateMachine, execution_input: Any, executions: int, concurrency: int) -> Tuple[List[Dict[str, Any]], float]:
+    """Run `executions` copies of the workflow, `concurrency` at a time.
+
+    With a concurrency of 1 executions run sequentially on the calling (main)
+    thread, like a Lambda invocation, so SCAN_MODE=budgeted can use its timer.
+    """
+    started = time.perf_counter()
+    if concurrency <= 1:
+        results = [machine.execute(_json_copy(execution_input), f"local-{i}") for i in range(executions)]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(lambda i: machine.execute(_json_copy(execution_input), f"local-{i}"), range(executions)))
+    return results, time.perf_counter() - started
+
+
+# Per-process state for --processes workers, set up once by _init_worker
+_WORKER_MACHINE: Optional[LocalStateMachine] = None
+
+
+def _init_worker(definition_path: str, specs: Dict[str, str], time_scale: float, quiet: bool) -> None:
+    global _WORKER_MACHINE
+    if quiet:
+        devnull = open(os.devnull, "w")
+        sys.stdout = devnull
+
+        def _restore_stdout() -> None:
+            sys.stdout = sys.__stdout__
+            devnull.close()
+
+        # Runs when the worker process exits
+        multiprocessing.util.Finalize(None, _restore_stdout, exitpriority=10)
+    handlers = {name: load_handler(spec) for name, spec in specs.items()}
+    _WORKER_MACHINE = LocalStateMachine.from_file(Path(definition_path), handlers=handlers, time_scale=time_scale)
+
+
+def _worker_execute(job: Tuple[Any, str]) -> Dict[str, Any]:
+    execution_input, name = job
+    assert _WORKER_MACHINE is not None
+    return _WORKER_MACHINE.execute(execution_input, name)
+
+
+def run_load_processes(
+    definition_path: Path,
+    specs: Dict[str, str],
+    execution_input: Any,
+    executions: int,
+    concurrency: int,
+    time_scale: float = 1.0,
+    quiet: bool = False,
+) -> Tuple[List[Dict[str, Any]], float]:
+    """Like run_load, but each worker is a separate process with its own GIL.
+
+    Handlers are loaded from `specs` in every worker, and each execution runs on
+    its worker's main thread, as a Lambda invocation does.
+    """
+    started = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=max(1, concurrency),
+        initializer=_init_worker,
+        initargs=(str(definition_path), specs, time_scale, quiet),
+    ) as pool:
+        jobs = [(execution_input, f"local-{i}") for i in range(executions)]
+        results = list(pool.map(_worker_execute, jobs))
+    return results, time.perf_counter() - started
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"Executions: {report['executions']} (succeeded {report['succeeded']}, failed {report['failed']}) "
+        f"in {report['wall_s']:.2f}s, {report['throughput_per_s']:.2f}/s, p50 {report['p50_ms']:.1f} ms, p95 {report['p95_ms']:.1f} ms"
+    )
+    if report["latency_note"]:
+        print(f"Note: {report['latency_note']}")
+    for error, n in report["failures"].items():
+        print(f"  failed with {error}: {n}")
+    print(f"{'state':<18} {'count':>6} {'p50_ms':>9} {'p95_ms':>9} {'max_ms':>9} {'avg_in_B':>10} {'max_out_B':>10} {'errors':>7} {'retries':>8}")
+    for s in report["states"]:
+        flag = "  <-- over payload limit" if s["max_output_bytes"] > report["payload_limit_bytes"] else ""
+        print(
+            f"{s['state']:<18} {s['count']:>6} {s['p50_ms']:>9.1f} {s['p95_ms']:>9.1f} {s['max_ms']:>9.1f} "
+            f"{s['avg_input_bytes']:>10} {s['max_output_bytes']:>10} {s['errors']:>7} {s['retries']:>8}{flag}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--definition", default=str(DEFINITION_PATH), help="ASL definition to run")
+    parser.add_argument("--input", help="execution input JSON file (default: sample ingestion event)")
+    parser.add_argument("--executions", type=int, default=1)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="parallel executions; above 1 they run on threads, where SCAN_MODE=budgeted "
+        "rule budgets are only checked cooperatively between matches",
+    )
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="with --concurrency above 1, run executions in worker processes instead of threads "
+        "(no GIL contention; each execution runs on its worker's main thread)",
+    )
+    parser.add_argument("--time-scale", type=float, default=1.0, help="multiplier for Retry delays (0 = no waiting)")
+    parser.add_argument("--handler", action="append", default=[], metavar="NAME=SPEC", help="module:function or @payload.json")
+    parser.add_argument("--quiet", action="store_true", help="suppress handler stdout")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    specs = dict(DEFAULT_HANDLERS)
+    for item in args.handler:
+        name, sep, spec = item.partition("=")
+        if not sep:
+            parser.error(f"--handler expects NAME=SPEC, got {item!r}")
+        specs[name] = spec
+
+    execution_input = DEFAULT_EVENT
+    if args.input:
+        with open(args.input, "r", encoding="utf-8") as fh:
+            execution_input = json.load(fh)
+
+    if args.concurrency <= 1:
+        runner = "sequential"
+    else:
+        runner = "processes" if args.processes else "threads"
+
+    if runner == "processes":
+        executions, wall_s = run_load_processes(
+            Path(args.definition), specs, execution_input, args.executions, args.concurrency, args.time_scale, args.quiet
+        )
+    else:
+        handlers = {name: load_handler(spec) for name, spec in specs.items()}
+        machine = LocalStateMachine.from_file(Path(args.definition), handlers=handlers, time_scale=args.time_scale)
+        sink = contextlib.redirect_stdout(io.StringIO()) if args.quiet else contextlib.nullcontext()
+        with sink:
+            executions, wall_s = run_load(machine, execution_input, args.executions, args.concurrency)
+
+    report = summarize(executions, wall_s, runner)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        if args.executions == 1:
+            ex = executions[0]
+            print("Execution output:\n", json.dumps(ex["output"] if ex["output"] is not None else ex["error"], indent=2))
+        _print_report(report)
+    return 0 if report["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
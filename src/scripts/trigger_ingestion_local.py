@@ -2,7 +2,9 @@
 """Trigger script: start the Step Functions state machine which triggers ingestion.
 
 By default this script will call AWS Step Functions StartExecution. To run
-locally (skip SFN and call ingestion handler directly) set LOCAL=1.
+locally (skip SFN and call ingestion handler directly) set LOCAL=1. To run
+the whole state machine in-process (ingestion, compliance and PrepareOutput)
+use run_workflow_local.py instead.
 
 Environment variables:
   ENV (default: dev)
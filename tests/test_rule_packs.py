@@ -0,0 +1,125 @@
+import os
+import sys
+import json
+import time
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.agents.compliance import rule_packs  # noqa: E402
+
+
+PACK = {
+    "name": "demo",
+    "version": "2.1.0",
+    "regulation": "DEMO",
+    "rules": [
+        {"id": "email", "rule_id": "gdpr_pii", "type": "regex", "pattern": r"\w+@\w+\.com", "severity": "high", "max_matches": 2},
+        {"id": "kw", "rule_id": "sox_keyword", "type": "keyword", "keywords": ["Audit", "net income", "income"], "severity": "medium", "context_chars": 5},
+    ],
+}
+
+
+@pytest.fixture
+def pack_dir(tmp_path):
+    (tmp_path / "demo.json").write_text(json.dumps(PACK))
+    rule_packs._PACK_CACHE.clear()
+    yield str(tmp_path)
+    rule_packs._PACK_CACHE.clear()
+
+
+def test_scan_tags_findings_with_pack_version(pack_dir):
+    pack = rule_packs.load_rule_pack("demo", pack_dir)
+    text = "a@x.com b@y.com c@z.com. Net income subject to AUDIT."
+    findings = rule_packs.scan_text(text, pack)
+
+    emails = [f for f in findings if f.get("type") == "email"]
+    assert [f["match"] for f in emails] == ["a@x.com", "b@y.com"]
+    assert [f["keyword"] for f in findings if "keyword" in f] == ["audit", "net income", "income"]
+    assert {f["rule_pack"] for f in findings} == {"demo@2.1.0"}
+
+
+def test_load_is_memoized_and_prefers_compiled_artifact(pack_dir):
+    out_path = rule_packs.compile_rule_pack_file(os.path.join(pack_dir, "demo.json"))
+    assert out_path.endswith("demo.compiled.json")
+
+    first = rule_packs.load_rule_pack("demo", pack_dir)
+    assert rule_packs.load_rule_pack("demo", pack_dir) is first
+    assert first["regexes"]["email"].search("q@w.com")
+
+
+def test_stale_artifact_is_recompiled(pack_dir):
+    rule_packs.compile_rule_pack_file(os.path.join(pack_dir, "demo.json"))
+    updated = dict(PACK, version="2.2.0")
+    with open(os.path.join(pack_dir, "demo.json"), "w") as fh:
+        json.dump(updated, fh)
+
+    assert rule_packs.load_rule_pack("demo", pack_dir)["version"] == "2.2.0"
+
+
+@pytest.mark.parametrize(
+    "pack",
+    [
+        dict(PACK, rules=[{"id": "x", "rule_id": "r", "type": "regex", "pattern": "("}]),
+        dict(PACK, rules="abc"),
+        dict(PACK, rules=["abc"]),
+        dict(PACK, rules=[dict(PACK["rules"][1], keywords="audit")]),
+        dict(PACK, rules=[dict(PACK["rules"][1], keywords=[])]),
+        dict(PACK, rules=[dict(PACK["rules"][1], keywords=["audit", 3])]),
+        dict(PACK, rules=[dict(PACK["rules"][0], max_matches="10")]),
+        dict(PACK, rules=[dict(PACK["rules"][0], max_matches=0)]),
+        dict(PACK, rules=[dict(PACK["rules"][1], context_chars=-1)]),
+        dict(PACK, rules=[dict(PACK["rules"][1], context_chars=True)]),
+    ],
+    ids=[
+        "bad-pattern",
+        "rules-not-list",
+        "rule-not-object",
+        "keywords-string",
+        "keywords-empty",
+        "keywords-non-string",
+        "max-matches-string",
+        "max-matches-zero",
+        "context-chars-negative",
+        "context-chars-bool",
+    ],
+)
+def test_invalid_pack_is_rejected(pack):
+    with pytest.raises(ValueError):
+        rule_packs.compile_rule_pack(pack)
+
+
+@pytest.mark.parametrize("pattern", [r"(?i)secret", r"(?P<x>a)b", r"(a)\1"])
+def test_each_regex_rule_compiles_and_matches_on_its_own(pattern):
+    rules = [dict(PACK["rules"][0], id="a", pattern=pattern), dict(PACK["rules"][0], id="b", pattern=pattern)]
+    pack = rule_packs._materialize(rule_packs.compile_rule_pack(dict(PACK, rules=rules)))
+
+    assert {f["type"] for f in rule_packs.scan_text("SECRET ab aa", pack)} == {"a", "b"}
+
+
+@pytest.mark.benchmark
+def test_keyword_scan_on_large_document_stays_close_to_plain_substring_checks():
+    pack = rule_packs.load_rule_pack("sox", rule_packs.DEFAULT_PACK_DIR)
+    keywords = [kw for rule in pack["rules"] for kw in rule.get("keywords", [])]
+    text = "Lorem ipsum dolor sit amet, 0123-456 consectetur. " * 26000  # ~1.3 MB, no keywords
+
+    start = time.perf_counter()
+    baseline_hits = [kw for kw in keywords if kw in text.lower()]
+    baseline = time.perf_counter() - start
+
+    start = time.perf_counter()
+    findings = rule_packs.scan_text(text, pack)
+    elapsed = time.perf_counter() - start
+
+    assert findings == baseline_hits == []
+    assert elapsed < 5 * baseline + 0.02
+
+
+def test_artifact_without_source_loads_as_is(pack_dir):
+    rule_packs.compile_rule_pack_file(os.path.join(pack_dir, "demo.json"))
+    os.remove(os.path.join(pack_dir, "demo.json"))
+
+    assert rule_packs.load_rule_pack("demo", pack_dir)["version"] == "2.1.0"
@@ -0,0 +1,151 @@
+import os
+import sys
+import json
+import threading
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.scripts import run_workflow_local as local  # noqa: E402
+
+
+EVENT = {"contract_id": "c-1", "s3": {"bucket": "b", "key": "contracts/c.pdf"}}
+
+
+def fake_ingestion(event, context):
+    return {
+        "status": "ok",
+        "contract_id": event["contract_id"],
+        "s3": event["s3"],
+        "extracted_text": "Contact alice@example.com",
+        "extracted_lines": ["Contact alice@example.com"],
+        "metadata": {"n_lines": 1, "n_chars": 25},
+    }
+
+
+def fake_compliance(event, context):
+    return {
+        "status": "ok",
+        "contract_id": event["contract_id"],
+        "s3": event["s3"],
+        "findings": [{"rule_id": "gdpr_pii", "type": "email", "match": "alice@example.com", "severity": "high"}],
+        "summary": {"n_findings": 1},
+        "rule_packs": {"gdpr": "1.0.0"},
+        "rule_packs_failed": [],
+        "scan": {"mode": "fast"},
+        "bedrock_used": False,
+        "bedrock_response": None,
+    }
+
+
+def machine(**handlers):
+    table = {"INGESTION_LAMBDA": fake_ingestion, "COMPLIANCE_LAMBDA": fake_compliance}
+    table.update(handlers)
+    return local.LocalStateMachine.from_file(handlers=table, time_scale=0)
+
+
+def test_pipeline_runs_to_prepare_output():
+    ex = machine().execute(EVENT)
+
+    assert ex["status"] == "SUCCEEDED"
+    assert ex["output"]["s3_location"] == "s3://b/contracts/c.pdf"
+    assert ex["output"]["findings"][0]["match"] == "alice@example.com"
+    assert [s["state"] for s in ex["states"]] == ["IngestionAgent", "ComplianceAgent", "PrepareOutput", "WorkflowComplete"]
+    assert all(s["output_bytes"] > 0 for s in ex["states"])
+
+
+def test_retry_then_success():
+    calls = []
+
+    def flaky(event, context):
+        calls.append(1)
+        if len(calls) < 3:
+            raise RuntimeError("boom")
+        return fake_ingestion(event, context)
+
+    ex = machine(INGESTION_LAMBDA=flaky).execute(EVENT)
+
+    assert ex["status"] == "SUCCEEDED"
+    assert ex["states"][0]["attempts"] == 3
+
+
+def test_exhausted_retries_are_caught():
+    def broken(event, context):
+        raise ValueError("bad document")
+
+    ex = machine(COMPLIANCE_LAMBDA=broken).execute(EVENT)
+
+    assert ex["status"] == "FAILED"
+    assert ex["error"] == {"Error": None, "Cause": "Ingestion or Compliance step failed"}
+    assert ex["states"][-1]["state"] == "WorkflowFailed"
+    assert ex["states"][1]["attempts"] == 4
+    assert ex["states"][1]["error"] == "ValueError"
+    assert ex["states"][-1]["error"] == "Ingestion or Compliance step failed"
+
+    report = local.summarize([ex], 1.0)
+    assert report["failures"] == {"Ingestion or Compliance step failed": 1}
+    assert next(s for s in report["states"] if s["state"] == "WorkflowFailed")["errors"] == 1
+
+
+def test_oversized_output_fails_with_data_limit():
+    def bloated(event, context):
+        out = fake_ingestion(event, context)
+        out["extracted_text"] = "x" * (local.MAX_PAYLOAD_BYTES + 1)
+        return out
+
+    ex = machine(INGESTION_LAMBDA=bloated).execute(EVENT)
+
+    assert ex["status"] == "FAILED"
+    assert ex["error"]["Error"] == "States.DataLimitExceeded"
+
+
+@pytest.mark.parametrize(
+    "expr, expected",
+    [
+        ("States.Format('s3://{}/{}', $.b, $.k)", "s3://bk/x.pdf"),
+        ("States.Format('\\{{}\\}', $.n)", "{3}"),
+        ("States.JsonToString($.o)", '{"a":1}'),
+    ],
+)
+def test_intrinsics(expr, expected):
+    data = {"b": "bk", "k": "x.pdf", "n": 3, "o": {"a": 1}}
+    assert local.eval_intrinsic(expr, data, {}) == expected
+
+
+def test_concurrent_load_report():
+    executions, wall_s = local.run_load(machine(), EVENT, executions=20, concurrency=4)
+    report = local.summarize(executions, wall_s, runner="threads")
+
+    assert report["succeeded"] == 20
+    assert "GIL" in report["latency_note"]
+    states = {s["state"]: s for s in report["states"]}
+    assert states["ComplianceAgent"]["count"] == 20
+    assert states["PrepareOutput"]["max_output_bytes"] > states["IngestionAgent"]["avg_input_bytes"]
+
+
+def test_single_concurrency_runs_on_main_thread():
+    seen = []
+
+    def recording(event, context):
+        seen.append(threading.current_thread() is threading.main_thread())
+        return fake_ingestion(event, context)
+
+    executions, _ = local.run_load(machine(INGESTION_LAMBDA=recording), EVENT, executions=3, concurrency=1)
+
+    assert [ex["status"] for ex in executions] == ["SUCCEEDED"] * 3
+    assert seen == [True, True, True]
+
+
+def test_process_pool_load(tmp_path):
+    (tmp_path / "ing.json").write_text(json.dumps(fake_ingestion(EVENT, None)))
+    (tmp_path / "comp.json").write_text(json.dumps(fake_compliance(EVENT, None)))
+    specs = {"INGESTION_LAMBDA": f"@{tmp_path / 'ing.json'}", "COMPLIANCE_LAMBDA": f"@{tmp_path / 'comp.json'}"}
+
+    executions, wall_s = local.run_load_processes(local.DEFINITION_PATH, specs, EVENT, executions=6, concurrency=2, time_scale=0, quiet=True)
+    report = local.summarize(executions, wall_s, runner="processes")
+
+    assert report["succeeded"] == 6
+    assert report["latency_note"] is None
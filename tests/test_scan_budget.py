@@ -0,0 +1,86 @@
+import os
+import sys
+import threading
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.agents.compliance import rule_packs  # noqa: E402
+from src.agents.compliance.scan_budget import ScanBudget  # noqa: E402
+
+
+PACK = rule_packs._materialize(
+    rule_packs.compile_rule_pack(
+        {
+            "name": "demo",
+            "version": "1.0.0",
+            "rules": [
+                {"id": "slow", "rule_id": "gdpr_pii", "type": "regex", "pattern": r"[a-z]+@[a-z]+\.com", "severity": "high"},
+                {"id": "ssn", "rule_id": "gdpr_pii", "type": "regex", "pattern": r"\b\d{3}-\d{2}-\d{4}\b", "severity": "high"},
+                {"id": "kw", "rule_id": "sox_keyword", "type": "keyword", "keywords": ["audit"], "severity": "medium"},
+            ],
+        }
+    )
+)
+
+# Quadratic for the `slow` rule: every start position rescans the whole run
+PATHOLOGICAL = "a" * 40000 + " 123-45-6789 audit"
+
+
+def _status(budget):
+    return {r["rule"]: r["status"] for r in budget.rules}
+
+
+def test_budgeted_scan_records_stats_and_matches_fast_scan():
+    text = "mail bob@x.com, ssn 123-45-6789, audit"
+    budget = ScanBudget(rule_ms=5000, document_ms=10000)
+    assert rule_packs.scan_text(text, PACK, budget) == rule_packs.scan_text(text, PACK)
+
+    summary = budget.summary()
+    assert summary["degraded"] is False
+    assert {r["rule"]: r["matches"] for r in summary["rules"]} == {"kw": 1, "slow": 1, "ssn": 1}
+    assert all(r["elapsed_ms"] >= 0 for r in summary["rules"])
+
+
+def test_slow_rule_is_cut_off_and_others_still_run():
+    budget = ScanBudget(rule_ms=20, document_ms=10000)
+    findings = rule_packs.scan_text(PATHOLOGICAL, PACK, budget)
+
+    assert _status(budget)["slow"] == "cutoff"
+    assert budget.summary()["degraded"] is True
+    assert {f.get("type") or f.get("keyword") for f in findings} == {"ssn", "audit"}
+
+
+def test_exhausted_document_budget_skips_remaining_rules():
+    budget = ScanBudget(rule_ms=20, document_ms=20)
+    rule_packs.scan_text(PATHOLOGICAL, PACK, budget)
+
+    assert _status(budget)["ssn"] == "skipped"
+
+
+def test_budget_falls_back_to_cooperative_checks_off_main_thread():
+    budget = ScanBudget(rule_ms=20, document_ms=10000)
+    # One search with no match: the cooperative check between matches never runs
+    worker = threading.Thread(target=rule_packs.scan_text, args=("a" * 10000, PACK, budget))
+    worker.start()
+    worker.join()
+
+    slow = next(r for r in budget.rules if r["rule"] == "slow")
+    assert slow["status"] == "overrun"
+    assert slow["elapsed_ms"] > 20
+    assert budget.summary()["degraded"] is True
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("run", ["a", "1", "1-", "a."])
+def test_shipped_gdpr_rules_stay_linear_on_large_malformed_text(run):
+    rule_packs._PACK_CACHE.clear()
+    pack = rule_packs.load_rule_pack("gdpr", rule_packs.DEFAULT_PACK_DIR)
+    budget = ScanBudget(rule_ms=200, document_ms=100000)
+    rule_packs.scan_text(run * (400000 // len(run)), pack, budget)
+
+    # Unbounded quantifiers took several seconds here despite the 200 ms budget
+    assert all(r["elapsed_ms"] < 1000 for r in budget.rules), budget.rules